@@ -0,0 +1,109 @@
+"""
+Shared Playwright setup for the Python browser smoke tests
+
+Browser, context and page fixtures come from pytest-playwright: one browser
+per xdist worker (--browser picks the engine, --headed shows it) and a
+fresh BrowserContext per test, so tests never share cookies or storage.
+This file only tunes those fixtures.
+Tests marked portal("admin") / portal("pilot") start from the session
+saved by scripts/seed_auth.py and are skipped when none is saved;
+portal(..., session=False) tests always run logged out.
+"""
+
+import os
+import sys
+
+import pytest
+from playwright.sync_api import Error as PlaywrightError
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'scripts'))
+
+import seed_auth  # noqa: E402
+
+# Small /dev/shm on CI containers crashes tabs; background contexts must not have their timers throttled
+CHROMIUM_ARGS = ['--disable-dev-shm-usage', '--disable-background-timer-throttling']
+
+# Assets the smoke tests never inspect; skipping them lets pages settle sooner
+BLOCKED_RESOURCE_TYPES = {'image', 'font', 'media'}
+if os.getenv('FAST_TEST') == '1':
+    BLOCKED_RESOURCE_TYPES.add('stylesheet')  # layout is irrelevant to anchor checks
+BLOCKED_URL_PARTS = ('googletagmanager', 'google-analytics', 'sentry', 'posthog', 'datadog', '/_vercel/')
+
+# Failure screenshots are JPEG: a fraction of a full-page PNG's size, and still readable
+SCREENSHOT_QUALITY = 70
+
+
+def pytest_addoption(parser):
+    parser.addoption('--fresh-auth', action='store_true', help='log in again even if saved sessions are still fresh')
+
+
+def pytest_configure(config):
+    """Refresh expired logins once, on the xdist controller only"""
+    if hasattr(config, 'workerinput') or config.option.collectonly or config.option.help:
+        return
+    base_url = config.getoption('base_url') or config.getini('base_url')
+    # Log in with the engine the tests run on so the saved cookies match what it accepts
+    engine = (config.getoption('browser') or ['chromium'])[0]
+    try:
+        seed_auth.seed(base_url, force=config.getoption('fresh_auth'), engine=engine)
+    except RuntimeError as e:
+        config.issue_config_time_warning(
+            pytest.PytestConfigWarning(f'Could not seed saved sessions; logged-in checks for these roles skip: {e}'),
+            stacklevel=2,
+        )
+
+
+@pytest.fixture(scope='session')
+def browser_type_launch_args(browser_type_launch_args, browser_name):
+    """Add the CI-friendly flags when the engine is Chromium"""
+    if browser_name != 'chromium':
+        return browser_type_launch_args
+    return {**browser_type_launch_args, 'args': CHROMIUM_ARGS}
+
+
+@pytest.fixture
+def browser_context_args(browser_context_args, base_url, request):
+    """1x 1280x800 viewport, logged in as the test's portal role unless it is marked session=False"""
+    args = {**browser_context_args, 'viewport': {'width': 1280, 'height': 800}, 'device_scale_factor': 1}
+    marker = request.node.get_closest_marker('portal')
+    if marker and marker.kwargs.get('session', True):
+        role = marker.args[0]
+        state = seed_auth.state_path(role, base_url)
+        if not os.path.exists(state):
+            # Logged out, the proxy would redirect to the login page and the check would pass on it
+            pytest.skip(f'no saved {role} session; set the TEST_* credentials used by scripts/seed_auth.py')
+        args['storage_state'] = state
+    return args
+
+
+def block_unused_assets(route):
+    """Abort images, fonts, media and analytics beacons; let everything else through"""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(part in request.url for part in BLOCKED_URL_PARTS):
+        route.abort()
+    else:
+        route.continue_()
+
+
+@pytest.fixture
+def context(context):
+    """The plugin's per-test context, with unused assets blocked"""
+    context.route('**/*', block_unused_assets)
+    return context
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Save a full-page JPEG of a failing test's page next to the plugin's other artifacts"""
+    outcome = yield
+    report = outcome.get_result()
+    page, output_path = item.funcargs.get('page'), item.funcargs.get('output_path')
+    if report.when != 'call' or not report.failed or page is None or output_path is None:
+        return
+    path = os.path.join(output_path, 'test-failed.jpg')
+    os.makedirs(output_path, exist_ok=True)
+    try:
+        page.screenshot(path=path, type='jpeg', quality=SCREENSHOT_QUALITY, full_page=True, timeout=5000)
+    except PlaywrightError:
+        return  # a crashed or closed page must not mask the test's own failure
+    report.sections.append(('Failure screenshot', path))
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Seed Playwright storage state for the Python browser smoke tests
+
+Logs in once per portal and saves the session so tests reuse it instead of
+re-authenticating on every run, one file per role and origin (scheme, host,
+port) so a run against another server never reuses these cookies. Saved
+states expire after an hour.
+Credentials come from the same TEST_* environment variables as the e2e suite.
+
+Usage: python3 scripts/seed_auth.py [--fresh] [--browser=chromium|firefox|webkit] [base_url]
+"""
+
+import json
+import os
+import re
+import sys
+import time
+from urllib.parse import urlsplit
+
+from playwright.sync_api import Error as PlaywrightError
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+from playwright.sync_api import sync_playwright
+
+MAX_AGE_SECONDS = 60 * 60
+
+# Repo-local and git-ignored; files hold live session cookies, so only the owner may read them
+STATE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.auth')
+
+# Login forms render failures in an alert; skip Next.js's route announcer
+LOGIN_ERROR = '[role="alert"]:not(#__next-route-announcer__)'
+
+# role -> (login path, user field, user env var, password env var, landing URL)
+LOGINS = {
+    'admin': ('/auth/login', 'input[type="email"]', 'TEST_ADMIN_EMAIL', 'TEST_ADMIN_PASSWORD', '**/dashboard**'),
+    'pilot': ('/portal/login', '#staffId', 'TEST_PILOT_STAFF_ID', 'TEST_PILOT_PASSWORD', re.compile(r'/portal/(?!login)')),
+}
+
+
+def state_path(role, base_url):
+    """Where the saved session for a role on base_url's origin lives"""
+    url = urlsplit(base_url)
+    origin = re.sub(r'[^\w.-]+', '_', f'{url.scheme}_{url.netloc}')
+    return os.path.join(STATE_DIR, f'{role}-{origin}.json')
+
+
+def save_state(context, path):
+    """Write a context's storage state readable by the current user only"""
+    os.makedirs(STATE_DIR, mode=0o700, exist_ok=True)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_NOFOLLOW, 0o600)
+    os.fchmod(fd, 0o600)
+    with os.fdopen(fd, 'w') as f:
+        json.dump(context.storage_state(), f)
+
+
+def is_fresh(path):
+    """True when a saved session exists and is younger than MAX_AGE_SECONDS"""
+    return os.path.exists(path) and time.time() - os.path.getmtime(path) < MAX_AGE_SECONDS
+
+
+def login(page, role):
+    """Run the login form for a role and wait for the post-login redirect"""
+    path, user_field, user_env, password_env, landing = LOGINS[role]
+    page.goto(path, wait_until='domcontentloaded')
+    form = page.locator('form')
+    form.locator(user_field).fill(os.environ[user_env])
+    form.locator('input[type="password"]').fill(os.environ[password_env])
+    try:
+        with page.expect_navigation(url=landing, wait_until='domcontentloaded', timeout=10000):
+            form.locator('button[type="submit"]').click()
+    except PlaywrightTimeoutError:
+        error = page.evaluate('selector => document.querySelector(selector)?.textContent ?? null', LOGIN_ERROR)
+        if error is not None:
+            raise RuntimeError(f"{role} login failed: {error}") from None
+        raise
+
+
+def seed(base_url, force=False, engine='chromium'):
+    """
+    Log in with the given Playwright engine and save state for every role that has
+    credentials and a stale (or forced) cache.
+    Returns the roles that were saved; raises RuntimeError naming every role that failed,
+    after deleting those roles' stale states so tests skip rather than run logged out.
+    """
+    roles = [
+        role
+        for role, (_, _, user_env, password_env, _) in LOGINS.items()
+        if os.getenv(user_env) and os.getenv(password_env) and (force or not is_fresh(state_path(role, base_url)))
+    ]
+    if not roles:
+        return []
+
+    saved, failures = [], {}
+    with sync_playwright() as p:
+        try:
+            browser = getattr(p, engine).launch()
+        except PlaywrightError as e:
+            failures = {role: e for role in roles}
+        else:
+            try:
+                for role in roles:
+                    context = browser.new_context(base_url=base_url)
+                    try:
+                        login(context.new_page(), role)
+                        save_state(context, state_path(role, base_url))
+                        saved.append(role)
+                    except (PlaywrightError, RuntimeError) as e:
+                        failures[role] = e
+                    finally:
+                        context.close()
+            finally:
+                browser.close()
+
+    if failures:
+        for role in failures:
+            if os.path.exists(state_path(role, base_url)):
+                os.remove(state_path(role, base_url))
+        raise RuntimeError('; '.join(f'{role}: {e}' for role, e in failures.items()))
+    return saved
+
+
+if __name__ == "__main__":
+    flags = [arg for arg in sys.argv[1:] if arg.startswith('--')]
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    engines = [flag.split('=', 1)[1] for flag in flags if flag.startswith('--browser=')]
+    base_url = args[0] if args else 'http://localhost:3003'
+    for role in seed(base_url, force='--fresh' in flags, engine=engines[-1] if engines else 'chromium'):
+        print(f"✅ Saved {role} session to {state_path(role, base_url)}")